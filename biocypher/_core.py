@@ -324,9 +324,9 @@ class BioCypher:
 
             logger.info(msg)
 
-            idmsg = ('Duplicate node IDs encountered: \n')
-            for _id in nids:
-                idmsg += f'    {_id}\n'
+            idmsg = 'Duplicate node IDs encountered: \n' + ''.join(
+                f'    {_id}\n' for _id in nids
+            )
 
             logger.debug(idmsg)
 
@@ -346,9 +346,9 @@ class BioCypher:
 
             logger.info(msg)
 
-            idmsg = ('Duplicate edge IDs encountered: \n')
-            for _id in eids:
-                idmsg += f'    {_id}\n'
+            idmsg = 'Duplicate edge IDs encountered: \n' + ''.join(
+                f'    {_id}\n' for _id in eids
+            )
 
             logger.debug(idmsg)
 
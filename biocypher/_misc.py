@@ -142,6 +142,7 @@ def create_tree_visualisation(inheritance_tree: Union[dict, nx.Graph]) -> str:
 # string conversion, adapted from Biolink Model Toolkit
 lowercase_pattern = re.compile(r'[a-zA-Z]*[a-z][a-zA-Z]*')
 underscore_pattern = re.compile(r'(?<!^)(?=[A-Z][a-z])')
+word_start_pattern = re.compile(r'(?:^| )([a-zA-Z])')
 
 
 def from_pascal(s: str, sep: str = ' ') -> str:
@@ -202,7 +203,7 @@ def sentencecase_to_pascalcase(s: str) -> str:
     Returns:
         string in PascalCase form
     """
-    return re.sub(r'(?:^| )([a-zA-Z])', lambda match: match.group(1).upper(), s)
+    return word_start_pattern.sub(lambda match: match.group(1).upper(), s)
 
 
 def to_lower_sentence_case(s: str) -> str:
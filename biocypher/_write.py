@@ -31,6 +31,47 @@ from ._create import BioCypherEdge, BioCypherNode, BioCypherRelAsNode
 
 __all__ = ['get_writer']
 
+# property types whose values are written without quotes
+UNQUOTED_TYPES = frozenset(
+    {
+        'int',
+        'long',
+        'float',
+        'double',
+        'dbl',
+        'bool',
+        'boolean',
+    }
+)
+
+# maximum number of part files kept open at the same time while writing
+MAX_OPEN_PARTS = 64
+
+# number of lines collected per label before they are written to its part
+PART_BUFFER_LINES = 1000
+
+# Neo4j header type per property type; other properties get no type suffix
+# and are imported as strings
+NODE_HEADER_TYPES = {
+    'int': 'long',
+    'long': 'long',
+    'float': 'double',
+    'double': 'double',
+    'dbl': 'double',
+    'bool': 'boolean',  # TODO Neo4j boolean support / spelling?
+    'boolean': 'boolean',
+    'str[]': 'string[]',
+    'string[]': 'string[]',
+}
+EDGE_HEADER_TYPES = {
+    'int': 'long',
+    'long': 'long',
+    'float': 'double',
+    'double': 'double',
+    'bool': 'boolean',  # TODO does Neo4j support bool?
+    'boolean': 'boolean',
+}
+
 if TYPE_CHECKING:
 
     from ._ontology import Ontology
@@ -91,6 +132,13 @@ class _Neo4jBatchWriter:
 
         strict_mode:
             Whether to enforce source, version, and license properties.
+
+        exact_dedup:
+            Whether to remember the full identifiers of written nodes and
+            edges for duplicate detection. If False, only their 64-bit
+            hashes are kept, which uses less memory on very large imports
+            but may, with very low probability, drop a distinct entity as
+            a duplicate.
     """
     def __init__(
         self,
@@ -107,6 +155,7 @@ class _Neo4jBatchWriter:
         import_call_file_prefix: Optional[str] = None,
         wipe: bool = True,
         strict_mode: bool = False,
+        exact_dedup: bool = True,
     ):
         self.db_name = db_name
 
@@ -125,6 +174,7 @@ class _Neo4jBatchWriter:
 
         self.wipe = wipe
         self.strict_mode = strict_mode
+        self.exact_dedup = exact_dedup
 
         self.extended_schema = ontology.extended_schema
         self.ontology = ontology
@@ -150,8 +200,9 @@ class _Neo4jBatchWriter:
             logger.info(f'Creating output directory `{self.outdir}`.')
             os.makedirs(self.outdir)
 
-        self.seen_node_ids = set()  # set to store the ids of nodes that have
-        # already been written; to avoid duplicates
+        self.seen_node_ids = set()  # set to store the ids (or their hashes,
+        # see `exact_dedup`) of nodes that have already been written; to
+        # avoid duplicates
         self.duplicate_node_ids = set(
         )  # set to store the ids of nodes that were
         # found to have duplicates (avoid overloading the log)
@@ -159,8 +210,9 @@ class _Neo4jBatchWriter:
         )  # set to store the types of nodes that
         # have been found to have duplicates
 
-        self.seen_edges = {}  # dict to store the set of edges that
-        # have already been written; to avoid duplicates; per edge type
+        self.seen_edges = defaultdict(set)  # dict to store the set of edges
+        # (or their hashes) that have already been written; to avoid
+        # duplicates; per edge type
         self.duplicate_edge_ids = set()  # set to store the ids of edges that
         # were found to have duplicates (avoid overloading the log)
         self.duplicate_edge_types = set(
@@ -170,6 +222,12 @@ class _Neo4jBatchWriter:
         # TODO not memory efficient, but should be fine for most cases; is
         # there a more elegant solution?
 
+        self.next_part = {}  # dict to store the number of the next part
+        # file per label; avoids listing the output directory for each batch
+
+        self.pascal_labels = {}  # dict to store the PascalCase version of
+        # each label; translated once, used for every header and part file
+
     def _process_delimiter(self, delimiter: str) -> str:
         """
         Return escaped characters in case of receiving their string
@@ -184,6 +242,20 @@ class _Neo4jBatchWriter:
 
             return delimiter, delimiter
 
+    def _to_pascal(self, label: str) -> str:
+        """
+        Return the PascalCase version of a label, translating each label only
+        once per writer instance.
+        """
+
+        pascal_label = self.pascal_labels.get(label)
+
+        if pascal_label is None:
+            pascal_label = self.translator.name_sentence_to_pascal(label)
+            self.pascal_labels[label] = pascal_label
+
+        return pascal_label
+
     def write_nodes(self, nodes, batch_size=int(1e6)):
         """
         Wrapper for writing nodes and their headers.
@@ -227,26 +299,24 @@ class _Neo4jBatchWriter:
             bool: The return value. True for success, False otherwise.
         """
         passed = False
-        # unwrap generator in one step
-        edges = list(edges)  # force evaluation to handle empty generator
-        if edges:
-            z = zip(
-                *(
-                    (
-                        e.get_node(),
-                        [
-                            e.get_source_edge(),
-                            e.get_target_edge(),
-                        ],
-                    ) if isinstance(e, BioCypherRelAsNode) else (None, [e])
-                    for e in edges
-                )
-            )
-            nod, edg = (list(a) for a in z)
-            nod = [n for n in nod if n]
-            edg = [val for sublist in edg for val in sublist]  # flatten
+        # unwrap generator in one pass, splitting RelAsNode into its node
+        # and edges without intermediate copies of the input
+        nod = []
+        edg = []
+        for e in edges:
+            if isinstance(e, BioCypherRelAsNode):
+                n = e.get_node()
+                if n:
+                    nod.append(n)
+                edg.append(e.get_source_edge())
+                edg.append(e.get_target_edge())
+            else:
+                edg.append(e)
 
-            if nod and edg:
+        # every input yields at least one edge, so this is the empty check
+        if edg:
+
+            if nod:
                 passed = self.write_nodes(nod) and self._write_edge_data(
                     edg,
                     batch_size,
@@ -293,131 +363,138 @@ class _Neo4jBatchWriter:
         if isinstance(nodes, GeneratorType) or isinstance(nodes, peekable):
             logger.debug('Writing node CSV from generator.')
 
-            bins = defaultdict(list)  # dict to store a list for each
-            # label that is passed in
-            bin_l = {}  # dict to store the length of each list for
-            # batching cutoff
+            parts = _PartFiles(self, batch_size)  # unfinished part file of
+            # each label that is passed in; lines are written as nodes arrive
             reference_props = defaultdict(
                 dict,
             )  # dict to store a dict of properties
             # for each label to check for consistency and their type
             # for now, relevant for `int`
-            labels = {}  # dict to store the additional labels for each
-            # primary graph constituent from biolink hierarchy
-            for node in nodes:
-                _id = node.get_id()
-                label = node.get_label()
-
-                # check for non-id
-                if not _id:
-                    logger.warning(f'Node {label} has no id; skipping.')
-                    continue
-
-                # check if node has already been written, if so skip
-                if _id in self.seen_node_ids:
-                    self.duplicate_node_ids.add(_id)
-                    if not label in self.duplicate_node_types:
-                        self.duplicate_node_types.add(label)
-                        logger.warning(
-                            f'Duplicate nodes found in type {label}. '
+            line_formats = {}  # dict to store the reference keys, columns
+            # and additional labels from biolink hierarchy for each label
+            seen_node_ids = self.seen_node_ids  # local for the hot loop
+            exact_dedup = self.exact_dedup
+            try:
+                for node in nodes:
+                    # exact type test first; isinstance only for subclasses
+                    if (
+                        type(node) is not BioCypherNode and
+                        not isinstance(node, BioCypherNode)
+                    ):
+                        logger.error(
+                            'Nodes must be passed as type BioCypherNode.'
                         )
-                    continue
-
-                if not label in bins.keys():
-                    # start new list
-                    all_labels = None
-                    bins[label].append(node)
-                    bin_l[label] = 1
-
-                    # get properties from config if present
-                    cprops = self.extended_schema.get(label).get('properties', )
-                    if cprops:
-                        d = dict(cprops)
-
-                        # add id and preferred id to properties; these are
-                        # created in node creation (`_create.BioCypherNode`)
-                        d['id'] = 'str'
-                        d['preferred_id'] = 'str'
-
-                        # add strict mode properties
-                        if self.strict_mode:
-                            d['source'] = 'str'
-                            d['version'] = 'str'
-                            d['licence'] = 'str'
+                        parts.discard()
+                        return False
+
+                    _id = node.get_id()
+                    label = node.get_label()
+
+                    # check for non-id
+                    if not _id:
+                        logger.warning(f'Node {label} has no id; skipping.')
+                        continue
+
+                    # check if node has already been written, if so skip
+                    seen_key = _id if exact_dedup else hash(_id)
+                    if seen_key in seen_node_ids:
+                        self.duplicate_node_ids.add(_id)
+                        if not label in self.duplicate_node_types:
+                            self.duplicate_node_types.add(label)
+                            logger.warning(
+                                f'Duplicate nodes found in type {label}. '
+                            )
+                        continue
 
-                    else:
-                        d = dict(node.get_properties())
-                        # encode property type
-                        for k, v in d.items():
-                            if d[k] is not None:
-                                d[k] = type(v).__name__
-                    # else use first encountered node to define properties for
-                    # checking; could later be by checking all nodes but much
-                    # more complicated, particularly involving batch writing
-                    # (would require "do-overs"). for now, we output a warning
-                    # if node properties diverge from reference properties (in
-                    # write_single_node_list_to_file) TODO if it occurs, ask
-                    # user to select desired properties and restart the process
-
-                    reference_props[label] = d
-
-                    # get label hierarchy
-                    # multiple labels:
-                    all_labels = self.ontology.get_ancestors(label)
-
-                    if all_labels:
-                        # convert to pascal case
-                        all_labels = [
-                            self.translator.name_sentence_to_pascal(label)
-                            for label in all_labels
-                        ]
-                        # remove duplicates
-                        all_labels = list(OrderedDict.fromkeys(all_labels))
-                        # order alphabetically
-                        all_labels.sort()
-                        # concatenate with array delimiter
-                        all_labels = self.adelim.join(all_labels)
-                    else:
-                        all_labels = self.translator.name_sentence_to_pascal(
-                            label
+                    if not label in line_formats:
+                        # first node of this label
+                        all_labels = None
+
+                        # get properties from config if present
+                        cprops = self.extended_schema.get(label).get(
+                            'properties',
                         )
+                        if cprops:
+                            if not self._check_property_types(label, cprops):
+                                parts.discard()
+                                return False
 
-                    labels[label] = all_labels
+                            d = dict(cprops)
 
-                else:
-                    # add to list
-                    bins[label].append(node)
-                    bin_l[label] += 1
-                    if not bin_l[label] < batch_size:
-                        # batch size controlled here
-                        passed = self._write_single_node_list_to_file(
-                            bins[label],
-                            label,
-                            reference_props[label],
-                            labels[label],
+                            # add id and preferred id to properties; these are
+                            # created in node creation (`_create.BioCypherNode`)
+                            d['id'] = 'str'
+                            d['preferred_id'] = 'str'
+
+                            # add strict mode properties
+                            if self.strict_mode:
+                                d['source'] = 'str'
+                                d['version'] = 'str'
+                                d['licence'] = 'str'
+
+                        else:
+                            d = dict(node.get_properties())
+                            # encode property type
+                            for k, v in d.items():
+                                if d[k] is not None:
+                                    d[k] = type(v).__name__
+                        # else use first encountered node to define properties
+                        # for checking; could later be by checking all nodes
+                        # but much more complicated, particularly involving
+                        # batch writing (would require "do-overs"). for now, we
+                        # output a warning if node properties diverge from
+                        # reference properties (in _node_line) TODO if it
+                        # occurs, ask user to select desired properties and
+                        # restart the process
+
+                        reference_props[label] = d
+
+                        # get label hierarchy
+                        # multiple labels:
+                        all_labels = self.ontology.get_ancestors(label)
+
+                        if all_labels:
+                            # convert to pascal case
+                            all_labels = [
+                                self._to_pascal(label) for label in all_labels
+                            ]
+                            # remove duplicates
+                            all_labels = list(OrderedDict.fromkeys(all_labels))
+                            # order alphabetically
+                            all_labels.sort()
+                            # concatenate with array delimiter
+                            all_labels = self.adelim.join(all_labels)
+                        else:
+                            all_labels = self._to_pascal(label)
+
+                        line_formats[label] = (
+                            d.keys(),
+                            self._columns(d),
+                            all_labels,
                         )
 
-                        if not passed:
-                            return False
+                    line = self._node_line(node, *line_formats[label])
 
-                        bins[label] = []
-                        bin_l[label] = 0
+                    if line is None:
+                        parts.discard()
+                        return False
 
-                self.seen_node_ids.add(_id)
+                    # write straight to the part of this label; batch size
+                    # controlled there
+                    parts.write(label, line)
 
-            # after generator depleted, write remainder of bins
-            for label, nl in bins.items():
-                passed = self._write_single_node_list_to_file(
-                    nl,
-                    label,
-                    reference_props[label],
-                    labels[label],
-                )
+                    seen_node_ids.add(seen_key)
+
+                # after generator depleted, close remaining part files
+                parts.close()
 
-                if not passed:
-                    return False
+            except BaseException:
+                # leave no truncated part behind for the import call to pick
+                # up
+                parts.discard()
+                raise
 
-            # use complete bin list to write header files
+            # use complete property dicts to write header files
             # TODO if a node type has varying properties
             # (ie missingness), we'd need to collect all possible
             # properties in the generator pass
@@ -465,7 +542,7 @@ class _Neo4jBatchWriter:
             # via the schema_config.yaml.
 
             # translate label to PascalCase
-            pascal_label = self.translator.name_sentence_to_pascal(label)
+            pascal_label = self._to_pascal(label)
 
             header_path = os.path.join(
                 self.outdir,
@@ -479,17 +556,8 @@ class _Neo4jBatchWriter:
                 # concatenate key:value in props
                 props_list = []
                 for k, v in props.items():
-                    if v in ['int', 'long']:
-                        props_list.append(f'{k}:long')
-                    elif v in ['float', 'double', 'dbl']:
-                        props_list.append(f'{k}:double')
-                    elif v in ['bool', 'boolean']:
-                        # TODO Neo4j boolean support / spelling?
-                        props_list.append(f'{k}:boolean')
-                    elif v in ['str[]', 'string[]']:
-                        props_list.append(f'{k}:string[]')
-                    else:
-                        props_list.append(f'{k}')
+                    n4_type = NODE_HEADER_TYPES.get(v)
+                    props_list.append(f'{k}:{n4_type}' if n4_type else k)
 
                 # create list of lists and flatten
                 # removes need for empty check of property list
@@ -520,97 +588,117 @@ class _Neo4jBatchWriter:
 
         return True
 
-    def _write_single_node_list_to_file(
+    @staticmethod
+    def _check_property_types(label: str, prop_dict: dict) -> bool:
+        """
+        Check that the property types of a class in the schema
+        configuration are given as type names, which the header and line
+        writers look up in their type tables.
+
+        Args:
+            label (str): the label (type) of the node or edge
+            prop_dict (dict): properties of the class and their types
+
+        Returns:
+            bool: True if all types are strings or empty, False otherwise.
+        """
+
+        for k, v in prop_dict.items():
+            if v is not None and not isinstance(v, str):
+                logger.error(
+                    f'Property {k!r} of {label!r} in the schema '
+                    f'configuration must have a type name such as "str" '
+                    f'or "int", got {v!r}.',
+                )
+                return False
+
+        return True
+
+    @staticmethod
+    def _columns(prop_dict: dict) -> list:
+        """
+        Return, for each property in header order, its name and whether
+        its value is written without quotes.
+
+        Args:
+            prop_dict (dict): properties of a node or edge class and their
+                types
+
+        Returns:
+            list: list of (property, unquoted) tuples
+        """
+
+        return [(k, v in UNQUOTED_TYPES) for k, v in prop_dict.items()]
+
+    def _node_line(
         self,
-        node_list: list,
-        label: str,
-        prop_dict: dict,
+        n: BioCypherNode,
+        ref_keys,
+        columns: list,
         labels: str,
-    ):
+    ) -> Optional[str]:
         """
-        This function takes one list of biocypher nodes and writes them
-        to a Neo4j admin import compatible CSV file.
+        This function turns one biocypher node into a Neo4j admin import
+        compatible CSV line.
 
         Args:
-            node_list (list): list of BioCypherNodes to be written
-            label (str): the primary label of the node
-            prop_dict (dict): properties of node class passed from parsing
-                function and their types
+            n (BioCypherNode): the node to be written
+            ref_keys (KeysView): reference properties of the node class
+            columns (list): properties in header order and whether they are
+                written unquoted, see :py:meth:`_columns`
             labels (str): string of one or several concatenated labels
                 for the node class
 
         Returns:
-            bool: The return value. True for success, False otherwise.
+            str: The CSV line, or None if the node properties deviate from
+                the reference properties.
         """
-        if not all(isinstance(n, BioCypherNode) for n in node_list):
-            logger.error('Nodes must be passed as type BioCypherNode.')
-            return False
-
-        # from list of nodes to list of strings
-        lines = []
 
-        for n in node_list:
+        # check for deviations in properties
+        # node properties
+        n_props = n.get_properties()
+        n_keys = n_props.keys()
 
-            # check for deviations in properties
-            # node properties
-            n_props = n.get_properties()
-            n_keys = list(n_props.keys())
-            # reference properties
-            ref_props = list(prop_dict.keys())
+        # compare key views order invariant, without building sets
+        if n_keys != ref_keys:
+            onode = n.get_id()
+            oprop1 = ref_keys - n_keys
+            oprop2 = n_keys - ref_keys
+            logger.error(
+                f'At least one node of the class {n.get_label()} '
+                f'has more or fewer properties than another. '
+                f'Offending node: {onode!r}, offending property: '
+                f'{max([oprop1, oprop2])}. '
+                f'All reference properties: {list(ref_keys)}, '
+                f'All node properties: {list(n_keys)}.',
+            )
+            return None
 
-            # compare lists order invariant
-            if not set(ref_props) == set(n_keys):
-                onode = n.get_id()
-                oprop1 = set(ref_props).difference(n_keys)
-                oprop2 = set(n_keys).difference(ref_props)
-                logger.error(
-                    f'At least one node of the class {n.get_label()} '
-                    f'has more or fewer properties than another. '
-                    f'Offending node: {onode!r}, offending property: '
-                    f'{max([oprop1, oprop2])}. '
-                    f'All reference properties: {ref_props}, '
-                    f'All node properties: {n_keys}.',
-                )
-                return False
+        quote = self.quote
+        adelim = self.adelim
+        delim = self.delim
 
-            line = [n.get_id()]
-
-            if ref_props:
-
-                plist = []
-                # make all into strings, put actual strings in quotes
-                for k, v in prop_dict.items():
-                    p = n_props.get(k)
-                    if p is None:  # TODO make field empty instead of ""?
-                        plist.append('')
-                    elif v in [
-                        'int',
-                        'long',
-                        'float',
-                        'double',
-                        'dbl',
-                        'bool',
-                        'boolean',
-                    ]:
-                        plist.append(str(p))
-                    else:
-                        if isinstance(p, list):
-                            plist.append(
-                                self.quote + self.adelim.join(p) + self.quote
-                            )
-                        else:
-                            plist.append(self.quote + str(p) + self.quote)
+        line = [n.get_id()]
 
-                line.append(self.delim.join(plist))
-            line.append(labels)
+        if columns:
 
-            lines.append(self.delim.join(line) + '\n')
+            plist = []
+            # make all into strings, put actual strings in quotes
+            for k, unquoted in columns:
+                p = n_props.get(k)
+                if p is None:  # TODO make field empty instead of ""?
+                    plist.append('')
+                elif unquoted:
+                    plist.append(str(p))
+                elif isinstance(p, list):
+                    plist.append(quote + adelim.join(p) + quote)
+                else:
+                    plist.append(quote + str(p) + quote)
 
-        # avoid writing empty files
-        if lines:
-            self._write_next_part(label, lines)
+            line.append(delim.join(plist))
+        line.append(labels)
 
-        return True
+        return delim.join(line) + '\n'
 
     def _write_edge_data(self, edges, batch_size):
         """
@@ -636,130 +724,143 @@ class _Neo4jBatchWriter:
         if isinstance(edges, GeneratorType):
             logger.debug('Writing edge CSV from generator.')
 
-            bins = defaultdict(list)  # dict to store a list for each
-            # label that is passed in
-            bin_l = {}  # dict to store the length of each list for
-            # batching cutoff
+            parts = _PartFiles(self, batch_size)  # unfinished part file of
+            # each label that is passed in; lines are written as edges arrive
             reference_props = defaultdict(
                 dict,
             )  # dict to store a dict of properties
             # for each label to check for consistency and their type
             # for now, relevant for `int`
-            for e in edges:
-                if isinstance(e, BioCypherRelAsNode):
-                    # shouldn't happen any more
-                    logger.error(
-                        "Edges cannot be of type 'RelAsNode'. "
-                        f'Caused by: {e}',
-                    )
-                    return False
-
-                if not (e.get_source_id() and e.get_target_id()):
-                    logger.error(
-                        'Edge must have source and target node. '
-                        f'Caused by: {e}',
-                    )
-                    continue
-
-                label = e.get_label()
+            line_formats = {}  # dict to store the reference keys, columns
+            # and PascalCase type for each label
+            seen_edges = self.seen_edges  # local for the hot loop
+            exact_dedup = self.exact_dedup
+            try:
+                for e in edges:
+                    # exact type test first; the isinstance checks only run
+                    # to diagnose anything that is not a plain BioCypherEdge
+                    if type(e) is not BioCypherEdge:
+                        if isinstance(e, BioCypherRelAsNode):
+                            # shouldn't happen any more
+                            logger.error(
+                                "Edges cannot be of type 'RelAsNode'. "
+                                f'Caused by: {e}',
+                            )
+                            parts.discard()
+                            return False
 
-                if not label in self.seen_edges.keys():
-                    self.seen_edges[label] = set()
+                        if not isinstance(e, BioCypherEdge):
+                            logger.error(
+                                'Edges must be passed as type BioCypherEdge.'
+                            )
+                            parts.discard()
+                            return False
 
-                src_tar_id = '_'.join([e.get_source_id(), e.get_target_id()])
+                    source_id = e.get_source_id()
+                    target_id = e.get_target_id()
 
-                # check for duplicates
-                if src_tar_id in self.seen_edges.get(label, set()):
-                    self.duplicate_edge_ids.add(src_tar_id)
-                    if not label in self.duplicate_edge_types:
-                        self.duplicate_edge_types.add(label)
-                        logger.warning(
-                            f'Duplicate edges found in type {label}. '
+                    if not (source_id and target_id):
+                        logger.error(
+                            'Edge must have source and target node. '
+                            f'Caused by: {e}',
                         )
-                    continue
+                        continue
 
-                else:
-                    self.seen_edges[label].add(src_tar_id)
+                    label = e.get_label()
+                    seen = seen_edges[label]
 
-                if not label in bins.keys():
-                    # start new list
-                    bins[label].append(e)
-                    bin_l[label] = 1
+                    src_tar_id = f'{source_id}_{target_id}'
+                    seen_key = src_tar_id if exact_dedup else hash(src_tar_id)
 
-                    # get properties from config if present
+                    # check for duplicates; one set membership test per edge
+                    if seen_key in seen:
+                        self.duplicate_edge_ids.add(src_tar_id)
+                        if not label in self.duplicate_edge_types:
+                            self.duplicate_edge_types.add(label)
+                            logger.warning(
+                                f'Duplicate edges found in type {label}. '
+                            )
+                        continue
 
-                    # check whether label is in ontology_adapter.leaves
-                    # (may not be if it is an edge that carries the
-                    # "label_as_edge" property)
-                    cprops = None
-                    if label in self.extended_schema:
-                        cprops = self.extended_schema.get(label).get(
-                            'properties',
-                        )
                     else:
-                        # try via "label_as_edge"
-                        for k, v in self.extended_schema.items():
-                            if isinstance(v, dict):
-                                if v.get('label_as_edge') == label:
-                                    cprops = v.get('properties')
-                                    break
-                    if cprops:
-                        d = cprops
-
-                        # add strict mode properties
-                        if self.strict_mode:
-                            d['source'] = 'str'
-                            d['version'] = 'str'
-                            d['licence'] = 'str'
+                        seen.add(seen_key)
 
-                    else:
-                        d = dict(e.get_properties())
-                        # encode property type
-                        for k, v in d.items():
-                            if d[k] is not None:
-                                d[k] = type(v).__name__
-                    # else use first encountered edge to define
-                    # properties for checking; could later be by
-                    # checking all edges but much more complicated,
-                    # particularly involving batch writing (would
-                    # require "do-overs"). for now, we output a warning
-                    # if edge properties diverge from reference
-                    # properties (in write_single_edge_list_to_file)
-                    # TODO
-
-                    reference_props[label] = d
+                    if not label in line_formats:
+                        # first edge of this label
 
-                else:
-                    # add to list
-                    bins[label].append(e)
-                    bin_l[label] += 1
-                    if not bin_l[label] < batch_size:
-                        # batch size controlled here
-                        passed = self._write_single_edge_list_to_file(
-                            bins[label],
-                            label,
-                            reference_props[label],
+                        # get properties from config if present
+
+                        # check whether label is in ontology_adapter.leaves
+                        # (may not be if it is an edge that carries the
+                        # "label_as_edge" property)
+                        cprops = None
+                        if label in self.extended_schema:
+                            cprops = self.extended_schema.get(label).get(
+                                'properties',
+                            )
+                        else:
+                            # try via "label_as_edge"
+                            for k, v in self.extended_schema.items():
+                                if isinstance(v, dict):
+                                    if v.get('label_as_edge') == label:
+                                        cprops = v.get('properties')
+                                        break
+                        if cprops:
+                            if not self._check_property_types(label, cprops):
+                                parts.discard()
+                                return False
+
+                            d = cprops
+
+                            # add strict mode properties
+                            if self.strict_mode:
+                                d['source'] = 'str'
+                                d['version'] = 'str'
+                                d['licence'] = 'str'
+
+                        else:
+                            d = dict(e.get_properties())
+                            # encode property type
+                            for k, v in d.items():
+                                if d[k] is not None:
+                                    d[k] = type(v).__name__
+                        # else use first encountered edge to define
+                        # properties for checking; could later be by
+                        # checking all edges but much more complicated,
+                        # particularly involving batch writing (would
+                        # require "do-overs"). for now, we output a warning
+                        # if edge properties diverge from reference
+                        # properties (in _edge_line)
+                        # TODO
+
+                        reference_props[label] = d
+
+                        line_formats[label] = (
+                            d.keys(),
+                            self._columns(d),
+                            self._to_pascal(label),
                         )
 
-                        if not passed:
-                            return False
+                    line = self._edge_line(e, *line_formats[label])
 
-                        bins[label] = []
-                        bin_l[label] = 0
+                    if line is None:
+                        parts.discard()
+                        return False
 
-            # after generator depleted, write remainder of bins
-            for label, nl in bins.items():
+                    # write straight to the part of this label; batch size
+                    # controlled there
+                    parts.write(label, line)
 
-                passed = self._write_single_edge_list_to_file(
-                    nl,
-                    label,
-                    reference_props[label],
-                )
+                # after generator depleted, close remaining part files
+                parts.close()
 
-                if not passed:
-                    return False
+            except BaseException:
+                # leave no truncated part behind for the import call to pick
+                # up
+                parts.discard()
+                raise
 
-            # use complete bin list to write header files
+            # use complete property dicts to write header files
             # TODO if a edge type has varying properties
             # (ie missingness), we'd need to collect all possible
             # properties in the generator pass
@@ -801,7 +902,7 @@ class _Neo4jBatchWriter:
             # :END_ID, :TYPE
 
             # translate label to PascalCase
-            pascal_label = self.translator.name_sentence_to_pascal(label)
+            pascal_label = self._to_pascal(label)
 
             # paths
             header_path = os.path.join(
@@ -816,17 +917,8 @@ class _Neo4jBatchWriter:
                 # concatenate key:value in props
                 props_list = []
                 for k, v in props.items():
-                    if v in ['int', 'long']:
-                        props_list.append(f'{k}:long')
-                    elif v in ['float', 'double']:
-                        props_list.append(f'{k}:double')
-                    elif v in [
-                        'bool',
-                        'boolean',
-                    ]:  # TODO does Neo4j support bool?
-                        props_list.append(f'{k}:boolean')
-                    else:
-                        props_list.append(f'{k}')
+                    n4_type = EDGE_HEADER_TYPES.get(v)
+                    props_list.append(f'{k}:{n4_type}' if n4_type else k)
 
                 # create list of lists and flatten
                 # removes need for empty check of property list
@@ -857,163 +949,166 @@ class _Neo4jBatchWriter:
 
         return True
 
-    def _write_single_edge_list_to_file(
+    def _edge_line(
         self,
-        edge_list: list,
-        label: str,
-        prop_dict: dict,
-    ):
+        e: BioCypherEdge,
+        ref_keys,
+        columns: list,
+        pascal_label: str,
+    ) -> Optional[str]:
         """
-        This function takes one list of biocypher edges and writes them
-        to a Neo4j admin import compatible CSV file.
+        This function turns one biocypher edge into a Neo4j admin import
+        compatible CSV line.
 
         Args:
-            edge_list (list): list of BioCypherEdges to be written
-
-            label (str): the label (type) of the edge
-
-            prop_dict (dict): properties of node class passed from parsing
-                function and their types
+            e (BioCypherEdge): the edge to be written
+            ref_keys (KeysView): reference properties of the edge class
+            columns (list): properties in header order and whether they are
+                written unquoted, see :py:meth:`_columns`
+            pascal_label (str): the label (type) of the edge in PascalCase
 
         Returns:
-            bool: The return value. True for success, False otherwise.
+            str: The CSV line, or None if the edge properties deviate from
+                the reference properties.
         """
 
-        if not all(isinstance(n, BioCypherEdge) for n in edge_list):
+        # check for deviations in properties
+        # edge properties
+        e_props = e.get_properties()
+        e_keys = e_props.keys()
 
-            logger.error('Edges must be passed as type BioCypherEdge.')
-            return False
+        # compare key views order invariant, without building sets
+        if e_keys != ref_keys:
+            oedge = f'{e.get_source_id()}-{e.get_target_id()}'
+            oprop1 = ref_keys - e_keys
+            oprop2 = e_keys - ref_keys
+            logger.error(
+                f'At least one edge of the class {e.get_label()} '
+                f'has more or fewer properties than another. '
+                f'Offending edge: {oedge!r}, offending property: '
+                f'{max([oprop1, oprop2])}. '
+                f'All reference properties: {list(ref_keys)}, '
+                f'All edge properties: {list(e_keys)}.',
+            )
+            return None
 
-        # from list of edges to list of strings
-        lines = []
-        for e in edge_list:
-            # check for deviations in properties
-            # edge properties
-            e_props = e.get_properties()
-            e_keys = list(e_props.keys())
-            ref_props = list(prop_dict.keys())
-
-            # compare list order invariant
-            if not set(ref_props) == set(e_keys):
-                oedge = f'{e.get_source_id()}-{e.get_target_id()}'
-                oprop1 = set(ref_props).difference(e_keys)
-                oprop2 = set(e_keys).difference(ref_props)
-                logger.error(
-                    f'At least one edge of the class {e.get_label()} '
-                    f'has more or fewer properties than another. '
-                    f'Offending edge: {oedge!r}, offending property: '
-                    f'{max([oprop1, oprop2])}. '
-                    f'All reference properties: {ref_props}, '
-                    f'All edge properties: {e_keys}.',
-                )
-                return False
+        quote = self.quote
+        adelim = self.adelim
+        delim = self.delim
+
+        if columns:
+
+            plist = []
+            # make all into strings, put actual strings in quotes
+            for k, unquoted in columns:
+                p = e_props.get(k)
+                if p is None:  # TODO make field empty instead of ""?
+                    plist.append('')
+                elif unquoted:
+                    plist.append(str(p))
+                elif isinstance(p, list):
+                    plist.append(quote + adelim.join(p) + quote)
+                elif '**' in p:
+                    plist.append(quote + p.replace('**', adelim) + quote)
+                else:
+                    plist.append(quote + str(p) + quote)
+
+            return delim.join(
+                [
+                    e.get_source_id(),
+                    # here we need a list of properties in
+                    # the same order as in the header
+                    delim.join(plist),
+                    e.get_target_id(),
+                    pascal_label,
+                ],
+            ) + '\n'
+
+        return delim.join(
+            [
+                e.get_source_id(),
+                e.get_target_id(),
+                pascal_label,
+            ],
+        ) + '\n'
+
+    def _next_part_path(self, label: str) -> str:
+        """
+        This function returns the path of the next part file for a label.
 
-            if ref_props:
-
-                plist = []
-                # make all into strings, put actual strings in quotes
-                for k, v in prop_dict.items():
-                    p = e_props.get(k)
-                    if p is None:  # TODO make field empty instead of ""?
-                        plist.append('')
-                    elif v in [
-                        'int',
-                        'long',
-                        'float',
-                        'double',
-                        'dbl',
-                        'bool',
-                        'boolean',
-                    ]:
-                        plist.append(str(p))
-                    else:
-                        if isinstance(p, list):
-                            plist.append(
-                                self.quote + self.adelim.join(p) + self.quote
-                            )
-                        elif '**' in p:
-                            plist.append(
-                                self.quote + p.replace('**', self.adelim) +
-                                self.quote
-                            )
-                        else:
-                            plist.append(self.quote + str(p) + self.quote)
+        Args:
+            label (str): the label (type) of the node or edge; internal
+            representation sentence case -> needs to become PascalCase
+            for disk representation
 
-                lines.append(
-                    self.delim.join(
+        Returns:
+            str: path of the part file
+        """
+        # translate label to PascalCase
+        label = self._to_pascal(label)
+
+        next_part = self.next_part.get(label)
+
+        if next_part is None:
+            # first part of this label: continue after any part files
+            # already present in self.outdir
+            files = glob.glob(os.path.join(self.outdir, f'{label}-part*.csv'))
+            # find file with highest part number
+            if files:
+                next_part = (
+                    max(
                         [
-                            e.get_source_id(),
-                            # here we need a list of properties in
-                            # the same order as in the header
-                            self.delim.join(plist),
-                            e.get_target_id(),
-                            self.translator.
-                            name_sentence_to_pascal(e.get_label(), ),
+                            int(
+                                f.split('.')[-2].split('-')[-1].replace(
+                                    'part', ''
+                                )
+                            ) for f in files
                         ],
-                    ) + '\n',
+                    ) + 1
                 )
             else:
-                lines.append(
-                    self.delim.join(
-                        [
-                            e.get_source_id(),
-                            e.get_target_id(),
-                            self.translator.
-                            name_sentence_to_pascal(e.get_label(), ),
-                        ],
-                    ) + '\n',
-                )
+                next_part = 0
 
-        # avoid writing empty files
-        if lines:
-            self._write_next_part(label, lines)
+        self.next_part[label] = next_part + 1
 
-        return True
+        return self._part_path(label, next_part)
 
-    def _write_next_part(self, label: str, lines: list):
+    def _release_part(self, label: str, path: str):
         """
-        This function writes a list of strings to a new part file.
+        This function hands back the number of a part file that has been
+        discarded, so that the next part of the label takes its place. Only
+        the number issued last for the PascalCase label can be reused;
+        otherwise the number is skipped, since a later part of the same
+        name may already exist.
 
         Args:
-            label (str): the label (type) of the edge; internal
-            representation sentence case -> needs to become PascalCase
-            for disk representation
+            label (str): the label (type) of the node or edge, as passed to
+                :py:meth:`_next_part_path`
+            path (str): path of the discarded part file
+        """
+        # translate label to PascalCase
+        label = self._to_pascal(label)
 
-            lines (list): list of strings to be written
+        last_part = self.next_part[label] - 1
 
-        Returns:
-            bool: The return value. True for success, False otherwise.
+        if path == self._part_path(label, last_part):
+            self.next_part[label] = last_part
+
+    def _part_path(self, label: str, part: int) -> str:
         """
-        # translate label to PascalCase
-        label = self.translator.name_sentence_to_pascal(label)
-
-        # list files in self.outdir
-        files = glob.glob(os.path.join(self.outdir, f'{label}-part*.csv'))
-        # find file with highest part number
-        if files:
-            next_part = (
-                max(
-                    [
-                        int(
-                            f.split('.')[-2].split('-')[-1].replace('part', '')
-                        ) for f in files
-                    ],
-                ) + 1
-            )
-        else:
-            next_part = 0
+        This function returns the path of a numbered part file.
 
-        # write to file
-        padded_part = str(next_part).zfill(3)
-        logger.info(
-            f'Writing {len(lines)} entries to {label}-part{padded_part}.csv',
-        )
-        file_path = os.path.join(self.outdir, f'{label}-part{padded_part}.csv')
+        Args:
+            label (str): the PascalCase label of the node or edge
+            part (int): the part number
 
-        with open(file_path, 'w', encoding='utf-8') as f:
+        Returns:
+            str: path of the part file
+        """
+
+        padded_part = str(part).zfill(3)
 
-            # concatenate with delimiter
-            f.writelines(lines)
+        return os.path.join(self.outdir, f'{label}-part{padded_part}.csv')
 
     def get_import_call(self) -> str:
         """
@@ -1109,6 +1204,128 @@ class _Neo4jBatchWriter:
             return None
 
 
+class _PartFiles:
+    """
+    Unfinished part files of a node or edge data pass, one per label. Lines
+    are collected per label and flushed to the part every
+    :py:data:`PART_BUFFER_LINES` lines; a part is closed once it holds
+    `batch_size` lines. At most :py:data:`MAX_OPEN_PARTS` files are kept
+    open; the least recently flushed one is closed and reopened in append
+    mode at its next flush, so inputs with many labels stay within the
+    limit of open file descriptors at the cost of one reopen per flush.
+
+    Args:
+        writer:
+            The batch writer, used for naming and numbering part files.
+
+        batch_size:
+            Number of lines per part file.
+    """
+    def __init__(self, writer: _Neo4jBatchWriter, batch_size: int):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.max_open = MAX_OPEN_PARTS
+        self.buffer_lines = PART_BUFFER_LINES
+
+        self.paths = {}  # dict to store the path of the unfinished part of
+        # each label, in the order the parts were started
+        self.counts = {}  # dict to store the number of lines in the
+        # unfinished part of each label, flushed or not
+        self.buffers = {}  # dict to store the lines of each label that are
+        # not yet flushed
+        self.handles = OrderedDict()  # open files by label, least recently
+        # flushed first
+
+    def write(self, label: str, line: str):
+        """
+        Add a line to the unfinished part of a label, starting a new part
+        if there is none, and close the part once it is full.
+        """
+
+        buffer = self.buffers.get(label)
+
+        if buffer is None:
+            self.paths[label] = self.writer._next_part_path(label)
+            self.counts[label] = 0
+            buffer = self.buffers[label] = []
+
+        buffer.append(line)
+        self.counts[label] += 1
+
+        if not self.counts[label] < self.batch_size:
+            self._finish(label)
+        elif not len(buffer) < self.buffer_lines:
+            self._flush(label)
+
+    def _flush(self, label: str):
+        """
+        Write the buffered lines of a label to its unfinished part.
+        """
+
+        buffer = self.buffers[label]
+        f = self.handles.get(label)
+
+        if f is None:
+            if len(self.handles) >= self.max_open:
+                self.handles.popitem(last=False)[1].close()
+
+            # append if earlier lines of this part have been flushed
+            mode = 'a' if self.counts[label] > len(buffer) else 'w'
+            f = self.handles[label] = open(
+                self.paths[label],
+                mode,
+                encoding='utf-8',
+            )
+
+        else:
+            self.handles.move_to_end(label)
+
+        f.writelines(buffer)
+        buffer.clear()
+
+    def _finish(self, label: str):
+        """
+        Flush and close the unfinished part of a label as complete.
+        """
+
+        self._flush(label)
+        self.handles.pop(label).close()
+
+        path = self.paths.pop(label)
+        n = self.counts.pop(label)
+        del self.buffers[label]
+        logger.info(f'Wrote {n} entries to {os.path.basename(path)}.')
+
+    def close(self):
+        """
+        Close all unfinished parts as complete.
+        """
+
+        for label in list(self.paths):
+            self._finish(label)
+
+    def discard(self):
+        """
+        Close and remove all unfinished parts, e.g. after encountering an
+        invalid entity or an error in the input, so that only completed
+        parts remain on disk. Their part numbers are released to the
+        writer, latest first.
+        """
+
+        for f in self.handles.values():
+            f.close()
+
+        for label, path in reversed(list(self.paths.items())):
+            if os.path.exists(path):
+                os.remove(path)
+            self.writer._release_part(label, path)
+
+        self.handles.clear()
+        self.paths.clear()
+        self.counts.clear()
+        self.buffers.clear()
+
+
 DBMS_TO_CLASS = {
     'neo4j': _Neo4jBatchWriter,
 }
@@ -1149,6 +1366,7 @@ def get_writer(
             import_call_file_prefix=dbms_config.get('import_call_file_prefix'),
             wipe=dbms_config.get('wipe'),
             strict_mode=strict_mode,
+            exact_dedup=dbms_config.get('exact_dedup', True),
         )
 
     return None
@@ -3,6 +3,7 @@ import os
 from genericpath import isfile
 import pytest
 
+from biocypher import _write
 from biocypher._write import _Neo4jBatchWriter
 from biocypher._create import BioCypherEdge, BioCypherNode, BioCypherRelAsNode
 
@@ -238,6 +239,36 @@ def test_write_node_data_from_large_gen(bw, path, _get_nodes):
     )
 
 
+def test_write_node_data_continues_existing_parts(bw, path):
+    # part file left over from a previous run
+    with open(os.path.join(path, 'Protein-part000.csv'), 'w') as f:
+        f.write('')
+
+    def node_gen(start):
+        for i in range(start, start + 4):
+            yield BioCypherNode(
+                node_id=f'p{i}',
+                node_label='protein',
+                properties={
+                    'score': 4 / (i + 1),
+                    'name': 'StringProperty1',
+                    'taxon': 9606,
+                    'genes': ['gene1', 'gene2'],
+                },
+            )
+
+    passed = bw._write_node_data(node_gen(0), batch_size=int(1e4))
+    passed = passed and bw._write_node_data(node_gen(4), batch_size=int(1e4))
+
+    p1_csv = os.path.join(path, 'Protein-part001.csv')
+    p2_csv = os.path.join(path, 'Protein-part002.csv')
+
+    assert passed
+    assert sum(1 for _ in open(p1_csv)) == 4
+    assert sum(1 for _ in open(p2_csv)) == 4
+    assert bw.next_part['Protein'] == 3
+
+
 @pytest.mark.parametrize('l', [1], scope='module')
 def test_too_many_properties(bw, _get_nodes):
     nodes = _get_nodes
@@ -288,6 +319,184 @@ def test_not_enough_properties(bw, path, _get_nodes):
     assert not passed and not isfile(p0_csv)
 
 
+def test_invalid_node_discards_unfinished_part(bw, path):
+    nodes = [
+        BioCypherNode(
+            node_id=f'p{i}',
+            node_label='protein',
+            properties={
+                'score': 4 / (i + 1),
+                'name': 'StringProperty1',
+                'taxon': 9606,
+                'genes': ['gene1', 'gene2'],
+            },
+        ) for i in range(3)
+    ]
+    nodes.append(
+        BioCypherNode(
+            node_id='p3',
+            node_label='protein',
+            properties={'p1': 'StringProperty1'},
+        )
+    )
+
+    def node_gen(nodes):
+        yield from nodes
+
+    passed = bw._write_node_data(node_gen(nodes), batch_size=2)
+
+    p0_csv = os.path.join(path, 'Protein-part000.csv')
+    p1_csv = os.path.join(path, 'Protein-part001.csv')
+
+    # completed part is kept, the unfinished one is removed
+    assert not passed
+    assert sum(1 for _ in open(p0_csv)) == 2
+    assert not isfile(p1_csv)
+    assert bw.next_part['Protein'] == 1
+
+
+def test_schema_property_type_not_a_string(bw, path, monkeypatch):
+    # e.g. a list written in schema_config.yaml
+    monkeypatch.setitem(
+        bw.extended_schema['protein'],
+        'properties',
+        {'name': ['str']},
+    )
+
+    nodes = [
+        BioCypherNode(
+            node_id='p1',
+            node_label='protein',
+            properties={'name': 'StringProperty1'},
+        )
+    ]
+
+    passed = bw._write_node_data((n for n in nodes), batch_size=1e6)
+
+    assert not passed
+    assert 'protein' not in bw.node_property_dict
+
+
+def test_invalid_edge_keeps_parts_of_same_pascal_label(bw, path):
+    def edge(i, label):
+        return BioCypherEdge(
+            source_id=f'p{i}',
+            target_id=f'q{i}',
+            relationship_label=label,
+        )
+
+    # 'rel x' and 'Rel x' both write to RelX parts
+    edges = [
+        edge(0, 'rel x'),
+        edge(1, 'Rel x'),
+        edge(2, 'Rel x'),
+        edge(3, 'Rel x'),
+        'invalid',
+    ]
+
+    passed = bw._write_edge_data((e for e in edges), batch_size=2)
+
+    assert not passed
+    assert not isfile(os.path.join(path, 'RelX-part000.csv'))
+    assert sum(1 for _ in open(os.path.join(path, 'RelX-part001.csv'))) == 2
+    assert not isfile(os.path.join(path, 'RelX-part002.csv'))
+
+    # completed part is not overwritten by the next pass
+    passed = bw._write_edge_data((e for e in [edge(4, 'rel x')]), 1)
+
+    assert passed
+    assert sum(1 for _ in open(os.path.join(path, 'RelX-part001.csv'))) == 2
+    assert sum(1 for _ in open(os.path.join(path, 'RelX-part002.csv'))) == 1
+
+
+def test_write_edge_data_more_labels_than_open_parts(
+    bw, path, monkeypatch
+):
+    monkeypatch.setattr(_write, 'MAX_OPEN_PARTS', 4)
+    monkeypatch.setattr(_write, 'PART_BUFFER_LINES', 2)
+    n_labels = 10
+
+    def edge_gen():
+        # interleave labels so that parts are closed and reopened
+        for i in range(5):
+            for j in range(n_labels):
+                yield BioCypherEdge(
+                    source_id=f'p{i}',
+                    target_id=f'q{i}',
+                    relationship_label=f'Rel{j}',
+                )
+
+    passed = bw._write_edge_data(edge_gen(), batch_size=3)
+
+    assert passed
+    for j in range(n_labels):
+        p0_csv = os.path.join(path, f'Rel{j}-part000.csv')
+        p1_csv = os.path.join(path, f'Rel{j}-part001.csv')
+        with open(p0_csv) as f:
+            p0 = [line.split(';')[0] for line in f]
+        with open(p1_csv) as f:
+            p1 = [line.split(';')[0] for line in f]
+        assert p0 == ['p0', 'p1', 'p2']
+        assert p1 == ['p3', 'p4']
+
+
+def test_write_edge_data_many_labels_opens_each_part_once(
+    bw, path, monkeypatch
+):
+    opened = []
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(_write, 'open', counting_open, raising=False)
+    n_labels = 3 * _write.MAX_OPEN_PARTS
+
+    def edge_gen():
+        # round robin over more labels than part files are kept open
+        for i in range(5):
+            for j in range(n_labels):
+                yield BioCypherEdge(
+                    source_id=f'p{i}',
+                    target_id=f'q{i}',
+                    relationship_label=f'Link{j}',
+                )
+
+    passed = bw._write_edge_data(edge_gen(), batch_size=int(1e6))
+
+    assert passed
+    assert len(opened) == n_labels
+    for j in range(n_labels):
+        p0_csv = os.path.join(path, f'Link{j}-part000.csv')
+        assert sum(1 for _ in open(p0_csv)) == 5
+
+
+def test_generator_error_discards_unfinished_parts(bw, path):
+    def node_gen():
+        for i in range(3):
+            yield BioCypherNode(
+                node_id=f'p{i}',
+                node_label='protein',
+                properties={
+                    'score': 4 / (i + 1),
+                    'name': 'StringProperty1',
+                    'taxon': 9606,
+                    'genes': ['gene1', 'gene2'],
+                },
+            )
+        raise ValueError('adapter failed')
+
+    with pytest.raises(ValueError):
+        bw._write_node_data(node_gen(), batch_size=2)
+
+    p0_csv = os.path.join(path, 'Protein-part000.csv')
+    p1_csv = os.path.join(path, 'Protein-part001.csv')
+
+    assert sum(1 for _ in open(p0_csv)) == 2
+    assert not isfile(p1_csv)
+    assert bw.next_part['Protein'] == 1
+
+
 def test_write_none_type_property_and_order_invariance(bw, path):
     # as introduced by translation using defined properties in
     # schema_config.yaml
@@ -780,6 +989,32 @@ def test_duplicate_nodes(bw, _get_nodes):
     assert 'p1' in bw.duplicate_node_ids
 
 
+def test_duplicate_nodes_hashed_ids(bw, path):
+    bw.exact_dedup = False
+
+    nodes = [
+        BioCypherNode(
+            node_id=f'p{i}',
+            node_label='protein',
+            properties={
+                'name': 'StringProperty1',
+                'score': 4.32,
+                'taxon': 9606,
+                'genes': ['gene1', 'gene2']
+            }
+        ) for i in [1, 2, 1]
+    ]
+
+    passed = bw.write_nodes(nodes)
+
+    p_csv = os.path.join(path, 'Protein-part000.csv')
+
+    assert passed
+    assert sum(1 for _ in open(p_csv)) == 2
+    assert 'p1' in bw.duplicate_node_ids
+    assert 'p1' not in bw.seen_node_ids
+
+
 @pytest.mark.parametrize('l', [4], scope='module')
 def test_get_duplicate_nodes(bw, _get_nodes):
     nodes = _get_nodes